@@ -1,52 +1,253 @@
-from fastapi import FastAPI, HTTPException, Query, Path, Body
+from fastapi import FastAPI, HTTPException, Query, Path, Body, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
 import httpx
 from typing import List, Optional
 import asyncio
-from pydantic import BaseModel
+import hashlib
+import logging
+import os
+import time
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict
 from fastapi_mcp import FastApiMCP
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+logger = logging.getLogger(__name__)
+
+# Base URL for the PokeAPI
+POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+
+# Redis instance used to cache PokeAPI data and store user teams
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+
+# How long a Redis connect or command may take before it counts as a failure
+REDIS_TIMEOUT_SECONDS = 0.5
+
+# PokeAPI data never changes, so cached entries can live for a day
+CACHE_TTL_SECONDS = 60 * 60 * 24
+
+# PokeAPI 404s are cached as an empty value for a short while, so repeated
+# lookups of unknown names don't all go upstream
+NOT_FOUND_TTL_SECONDS = 300
+
+# Pokemon data only changes with PokeAPI's dataset, so browsers and CDNs may keep it
+IMMUTABLE_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+
+# Responses smaller than this aren't worth compressing
+GZIP_MINIMUM_SIZE = 1024
+
+# Cap on simultaneous requests to PokeAPI, shared by every endpoint in one worker
+# process; with N workers the service as a whole may make up to N times as many
+POKEAPI_MAX_CONCURRENCY = 10
+_pokeapi_semaphore = asyncio.BoundedSemaphore(POKEAPI_MAX_CONCURRENCY)
+
+# Upstream statuses worth retrying; anything else (e.g. 404) is a real answer
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+POKEAPI_MAX_ATTEMPTS = 3
+
+class CircuitBreaker:
+    """Stop calling an upstream for a cool-down period after repeated failures"""
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+
+    def allow_request(self):
+        # Once the cool-down has passed, let requests through to probe the upstream
+        if self.opened_at is None:
+            return True
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+# Trips after 5 consecutive failed fetches and stays open for 30 seconds (per worker)
+pokeapi_breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP client for all PokeAPI calls during the app's lifetime"""
+    # HTTP/2 lets concurrent fetches share one connection instead of queueing
+    app.state.http = httpx.AsyncClient(
+        base_url=POKEAPI_BASE_URL,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        timeout=10.0
+    )
+    # Short timeouts make a stalled Redis raise RedisError instead of hanging the request
+    app.state.redis = aioredis.from_url(
+        REDIS_URL,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_TIMEOUT_SECONDS
+    )
+    app.state.add_team_member = app.state.redis.register_script(ADD_TEAM_MEMBER_SCRIPT)
+    prewarm_task = asyncio.create_task(prewarm_pokedexes())
+    try:
+        yield
+    finally:
+        prewarm_task.cancel()
+        await app.state.http.aclose()
+        await app.state.redis.aclose()
 
 app = FastAPI(
     title="Pokemon API",
     description="A fun API for Pokemon enthusiasts",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 mcp = FastApiMCP(app)
 mcp.mount()
 
-# Base URL for the PokeAPI
-POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+def etag_matches(if_none_match, etag):
+    """Check an If-None-Match header against an ETag using weak comparison"""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+@app.exception_handler(RedisError)
+async def redis_error_handler(request: Request, exc: RedisError):
+    """Report an unreachable Redis as a temporary outage, since teams are stored there"""
+    logger.warning("Redis error on %s: %s", request.url.path, type(exc).__name__)
+    return ORJSONResponse(status_code=503, content={"detail": "Team storage is temporarily unavailable"})
+
+class CacheValidatorMiddleware:
+    """Add ETag and Cache-Control headers to Pokemon responses and answer revalidations with 304"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Team routes are per-user and mutable, so only GET /pokemon/* is marked cacheable;
+        # everything else (including the MCP mount) passes straight through
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith("/pokemon/"):
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        chunks = []
+
+        async def send_with_validators(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                # Hold the start message until the whole body is known
+                start_message = message
+                return
+            if start_message is None:
+                await send(message)
+                return
+            
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            
+            body = b"".join(chunks)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            
+            if etag_matches(Headers(scope=scope).get("if-none-match"), etag):
+                # A 304 must repeat the Vary the 200 would have carried, including the
+                # Accept-Encoding that GZipMiddleware adds outside this middleware
+                not_modified = MutableHeaders(raw=[
+                    (name, value) for name, value in headers.raw
+                    if name in (b"etag", b"cache-control", b"vary")
+                ])
+                if len(body) >= GZIP_MINIMUM_SIZE:
+                    not_modified.add_vary_header("Accept-Encoding")
+                await send({"type": "http.response.start", "status": 304, "headers": not_modified.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_validators)
+
+# GZip is added last so it wraps the ETag middleware and compresses the already-hashed body
+app.add_middleware(CacheValidatorMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
 
-# Famous trainers and their known Pokemon
-FAMOUS_TRAINERS = {
-    "ash": [
+# Famous trainers and their known Pokemon (read-only, keys are lower-case)
+FAMOUS_TRAINERS = MappingProxyType({
+    "ash": (
         "pikachu", "charizard", "squirtle", "bulbasaur", "greninja", 
         "infernape", "sceptile", "lycanroc", "dragonite", "gengar"
-    ],
-    "misty": ["starmie", "staryu", "goldeen", "psyduck", "togepi", "gyarados"],
-    "brock": ["onix", "geodude", "vulpix", "crobat", "sudowoodo", "steelix"],
-    "gary": ["blastoise", "umbreon", "electivire", "arcanine", "nidoking", "scizor"],
-    "lance": ["dragonite", "gyarados", "aerodactyl", "charizard", "tyranitar"],
-    "cynthia": ["garchomp", "spiritomb", "milotic", "roserade", "togekiss", "lucario"]
-}
-
-# Pokemon regions
-POKEMON_REGIONS = {
-    "kanto": {"generation": "generation-i", "pokedex": "kanto"},
-    "johto": {"generation": "generation-ii", "pokedex": "original-johto"},
-    "hoenn": {"generation": "generation-iii", "pokedex": "hoenn"},
-    "sinnoh": {"generation": "generation-iv", "pokedex": "original-sinnoh"},
-    "unova": {"generation": "generation-v", "pokedex": "original-unova"},
-    "kalos": {"generation": "generation-vi", "pokedex": "kalos-central"},
-    "alola": {"generation": "generation-vii", "pokedex": "original-alola"},
-    "galar": {"generation": "generation-viii", "pokedex": "galar"}
-}
-
-# In-memory storage for user's Pokemon team
-# Structure: {user_id: [pokemon_details]}
-POKEMON_TEAMS = {}
+    ),
+    "misty": ("starmie", "staryu", "goldeen", "psyduck", "togepi", "gyarados"),
+    "brock": ("onix", "geodude", "vulpix", "crobat", "sudowoodo", "steelix"),
+    "gary": ("blastoise", "umbreon", "electivire", "arcanine", "nidoking", "scizor"),
+    "lance": ("dragonite", "gyarados", "aerodactyl", "charizard", "tyranitar"),
+    "cynthia": ("garchomp", "spiritomb", "milotic", "roserade", "togekiss", "lucario")
+})
+
+# Pokemon regions (read-only, keys are lower-case)
+POKEMON_REGIONS = MappingProxyType({
+    "kanto": MappingProxyType({"generation": "generation-i", "pokedex": "kanto"}),
+    "johto": MappingProxyType({"generation": "generation-ii", "pokedex": "original-johto"}),
+    "hoenn": MappingProxyType({"generation": "generation-iii", "pokedex": "hoenn"}),
+    "sinnoh": MappingProxyType({"generation": "generation-iv", "pokedex": "original-sinnoh"}),
+    "unova": MappingProxyType({"generation": "generation-v", "pokedex": "original-unova"}),
+    "kalos": MappingProxyType({"generation": "generation-vi", "pokedex": "kalos-central"}),
+    "alola": MappingProxyType({"generation": "generation-vii", "pokedex": "original-alola"}),
+    "galar": MappingProxyType({"generation": "generation-viii", "pokedex": "galar"})
+})
+
+# Base stats compared by /pokemon/compare
+COMPARED_STATS = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+
+# Recently built Pokemon details, least recently used first
+# Structure: {name_or_id: PokemonDetail}
+DETAILS_CACHE_SIZE = 4096
+_details_cache = OrderedDict()
+
+# Fetches currently in flight in this worker, so concurrent misses for the same key share one
+# Structure: {key: asyncio.Task}
+_inflight = {}
+
+# Teams live in Redis so every worker sees the same state
+MAX_TEAM_SIZE = 6
+
+# Atomically add a team member unless the team is full or already has it,
+# returning the updated team or a negative status code
+TEAM_FULL = -1
+ALREADY_IN_TEAM = -2
+ADD_TEAM_MEMBER_SCRIPT = """
+if redis.call("HLEN", KEYS[1]) >= tonumber(ARGV[3]) then
+    return -1
+end
+if redis.call("HSETNX", KEYS[1], ARGV[1], ARGV[2]) == 0 then
+    return -2
+end
+return redis.call("HVALS", KEYS[1])
+"""
 
 # Models for response
 class PokemonBase(BaseModel):
+    # Frozen so cached instances can be shared between requests without copying
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     types: List[str]
@@ -73,68 +274,186 @@ class TeamResponse(BaseModel):
 class AddPokemonRequest(BaseModel):
     pokemon_name: str
 
-async def fetch_pokemon_data(client, name_or_id):
-    """Fetch basic Pokemon data from PokeAPI"""
+async def cache_get(key):
+    """Read a value from Redis, treating an unreachable cache as a miss"""
     try:
-        response = await client.get(f"{POKEAPI_BASE_URL}/pokemon/{name_or_id.lower()}")
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception as e:
-        print(f"Error fetching Pokemon {name_or_id}: {str(e)}")
+        return await app.state.redis.get(key)
+    except RedisError as e:
+        logger.warning("Error reading cache key %s: %s: %s", key, type(e).__name__, e)
         return None
 
-async def fetch_pokemon_species(client, name_or_id):
-    """Fetch Pokemon species data from PokeAPI"""
+async def cache_set(key, value, ex=CACHE_TTL_SECONDS):
+    """Write a value to Redis, ignoring failures so the request still succeeds"""
+    try:
+        await app.state.redis.set(key, value, ex=ex)
+    except RedisError as e:
+        logger.warning("Error writing cache key %s: %s: %s", key, type(e).__name__, e)
+
+@retry(
+    retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+    stop=stop_after_attempt(POKEAPI_MAX_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=0.2, max=2.0),
+    reraise=True
+)
+async def get_with_retry(client, path):
+    """GET a PokeAPI path, retrying transient failures with jittered exponential backoff"""
+    # Hold the semaphore per attempt so backoff sleeps don't block other fetches
+    async with _pokeapi_semaphore:
+        response = await client.get(path)
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        response.raise_for_status()
+    return response
+
+async def coalesce(key, fetch):
+    """Run fetch() once for all concurrent callers asking for the same key"""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    
+    # Shield the shared fetch so one cancelled caller doesn't fail the others
+    return await asyncio.shield(task)
+
+async def fetch_pokeapi(client, resource, name_or_id, ex=CACHE_TTL_SECONDS):
+    """Fetch a raw PokeAPI document, serving repeat lookups from Redis"""
+    key = f"raw:{resource}:{name_or_id}"
+    blob = await cache_get(key)
+    if blob is None:
+        blob = await coalesce(key, lambda: download_pokeapi(client, resource, name_or_id, key, ex))
+    # Each caller decodes its own copy, so shared bytes never become shared dicts;
+    # an empty value is a cached 404
+    return orjson.loads(blob) if blob else None
+
+async def download_pokeapi(client, resource, name_or_id, key, ex):
+    """Download a PokeAPI document and store its raw bytes in Redis"""
+    if not pokeapi_breaker.allow_request():
+        raise HTTPException(status_code=503, detail="PokeAPI is temporarily unavailable")
+    
     try:
-        response = await client.get(f"{POKEAPI_BASE_URL}/pokemon-species/{name_or_id.lower()}")
-        if response.status_code == 200:
-            return response.json()
+        response = await get_with_retry(client, f"/{resource}/{name_or_id}")
+    except httpx.HTTPError as e:
+        pokeapi_breaker.record_failure()
+        # Log the upstream status when there is one, so 429s can be told apart from 5xx
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.warning("Error fetching /%s/%s: HTTP %d", resource, name_or_id, e.response.status_code)
+        else:
+            logger.warning("Error fetching /%s/%s: %s", resource, name_or_id, type(e).__name__)
+        raise HTTPException(status_code=503, detail="PokeAPI is temporarily unavailable") from e
+    
+    pokeapi_breaker.record_success()
+    if response.status_code == 404:
+        await cache_set(key, b"", ex=NOT_FOUND_TTL_SECONDS)
         return None
-    except Exception as e:
-        print(f"Error fetching Pokemon species {name_or_id}: {str(e)}")
+    if response.status_code != 200:
         return None
+    await cache_set(key, response.content, ex=ex)
+    return response.content
+
+async def fetch_pokedex(client, pokedex_name):
+    """Fetch a regional Pokedex, which is cached without expiry since it never changes"""
+    return await fetch_pokeapi(client, "pokedex", pokedex_name, ex=None)
+
+async def prewarm_pokedexes():
+    """Load every region's Pokedex into Redis so first region requests skip PokeAPI"""
+    for region_info in POKEMON_REGIONS.values():
+        try:
+            await fetch_pokedex(app.state.http, region_info["pokedex"])
+        except Exception as e:
+            logger.warning("Error prewarming Pokedex %s: %s", region_info["pokedex"], type(e).__name__)
+
+async def fetch_pokemon_data(client, name_or_id):
+    """Fetch basic Pokemon data from PokeAPI"""
+    return await fetch_pokeapi(client, "pokemon", name_or_id.lower())
+
+async def fetch_pokemon_species(client, name_or_id):
+    """Fetch Pokemon species data from PokeAPI"""
+    return await fetch_pokeapi(client, "pokemon-species", name_or_id.lower())
 
 async def get_pokemon_details(name_or_id):
+    """Get detailed Pokemon information, reusing recently built results"""
+    key = name_or_id.lower()
+    pokemon = _details_cache.get(key)
+    if pokemon is not None:
+        _details_cache.move_to_end(key)
+        return pokemon
+    
+    return await coalesce(f"details:{key}", lambda: load_pokemon_details(key, name_or_id))
+
+async def load_pokemon_details(key, name_or_id):
+    """Build Pokemon details and remember them in the in-process cache"""
+    pokemon = await build_pokemon_details(name_or_id)
+    if pokemon:
+        _details_cache[key] = pokemon
+        if len(_details_cache) > DETAILS_CACHE_SIZE:
+            _details_cache.popitem(last=False)
+    return pokemon
+
+async def build_pokemon_details(name_or_id):
     """Get detailed Pokemon information combining basic data and species data"""
-    async with httpx.AsyncClient() as client:
-        pokemon_data = await fetch_pokemon_data(client, name_or_id)
-        if not pokemon_data:
-            return None
-        
-        species_data = await fetch_pokemon_species(client, pokemon_data["id"])
-        
-        # Extract types
-        types = [t["type"]["name"] for t in pokemon_data["types"]]
-        
-        # Extract abilities
-        abilities = [a["ability"]["name"].replace("-", " ") for a in pokemon_data["abilities"]]
-        
-        # Extract stats
-        stats = {s["stat"]["name"]: s["base_stat"] for s in pokemon_data["stats"]}
-        
-        # Get English description if available
-        description = None
-        if species_data and "flavor_text_entries" in species_data:
-            english_entries = [entry for entry in species_data["flavor_text_entries"] 
-                              if entry["language"]["name"] == "en"]
-            if english_entries:
-                description = english_entries[0]["flavor_text"].replace("\n", " ").replace("\f", " ")
-        
-        return PokemonDetail(
-            id=pokemon_data["id"],
-            name=pokemon_data["name"],
-            types=types,
-            sprite_url=pokemon_data["sprites"]["front_default"],
-            height=pokemon_data["height"],
-            weight=pokemon_data["weight"],
-            abilities=abilities,
-            stats=stats,
-            is_legendary=species_data.get("is_legendary", False) if species_data else False,
-            is_mythical=species_data.get("is_mythical", False) if species_data else False,
-            description=description
+    client = app.state.http
+    # Species usually shares the Pokemon's name or id, so fetch both at once
+    pokemon_data, species_data = await asyncio.gather(
+        fetch_pokemon_data(client, name_or_id),
+        fetch_pokemon_species(client, name_or_id)
+    )
+    if not pokemon_data:
+        return None
+
+    # Alternate forms (e.g. "deoxys-attack") only resolve through their species name
+    if not species_data:
+        species_data = await fetch_pokemon_species(client, pokemon_data["species"]["name"])
+
+    # Extract types
+    types = [t["type"]["name"] for t in pokemon_data["types"]]
+
+    # Extract abilities
+    abilities = [a["ability"]["name"].replace("-", " ") for a in pokemon_data["abilities"]]
+
+    # Extract stats
+    stats = {s["stat"]["name"]: s["base_stat"] for s in pokemon_data["stats"]}
+
+    # Get English description if available, stopping at the first match
+    description = None
+    if species_data:
+        description = next(
+            (entry["flavor_text"].replace("\n", " ").replace("\f", " ")
+             for entry in species_data.get("flavor_text_entries", ())
+             if entry["language"]["name"] == "en"),
+            None
         )
 
+    # PokeAPI data is trusted, so skip validation when building the model
+    return PokemonDetail.model_construct(
+        id=pokemon_data["id"],
+        name=pokemon_data["name"],
+        types=types,
+        sprite_url=pokemon_data["sprites"]["front_default"],
+        height=pokemon_data["height"],
+        weight=pokemon_data["weight"],
+        abilities=abilities,
+        stats=stats,
+        is_legendary=species_data.get("is_legendary", False) if species_data else False,
+        is_mythical=species_data.get("is_mythical", False) if species_data else False,
+        description=description
+    )
+
+def json_response(blob):
+    """Wrap already-serialized JSON bytes, skipping response model validation"""
+    return Response(content=blob, media_type="application/json")
+
+def find_highest_and_lowest(pokemon_list, key):
+    """Find the (name, value) pairs with the highest and lowest value in a single pass"""
+    lowest = highest = None
+    for pokemon in pokemon_list:
+        value = key(pokemon)
+        # Strict comparisons keep the first Pokemon on ties, like min() and max()
+        if lowest is None or value < lowest[1]:
+            lowest = (pokemon.name, value)
+        if highest is None or value > highest[1]:
+            highest = (pokemon.name, value)
+    return {"highest": highest, "lowest": lowest}
+
 @app.get("/", tags=["General"])
 def read_root():
     return {
@@ -161,59 +480,54 @@ async def compare_pokemon(pokemon_names: List[str] = Query(..., min_length=2, ma
         raise HTTPException(status_code=400, detail="You can compare a maximum of 6 Pokemon")
     
     pokemon_list = []
-    async with httpx.AsyncClient() as client:
-        tasks = [get_pokemon_details(name) for name in pokemon_names]
-        results = await asyncio.gather(*tasks)
-        
-        for result in results:
-            if result:
-                pokemon_list.append(result)
+    tasks = [get_pokemon_details(name) for name in pokemon_names]
+    results = await asyncio.gather(*tasks)
+    
+    for result in results:
+        if result:
+            pokemon_list.append(result)
     
     if not pokemon_list:
         raise HTTPException(status_code=404, detail="None of the requested Pokemon were found")
     
-    # Create comparison data
-    comparison = {
-        "stats": {},
-        "types": {},
-        "height": {},
-        "weight": {}
-    }
-    
-    # Compare stats
-    for stat in ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]:
-        comparison["stats"][stat] = {
-            "highest": max([(p.name, p.stats.get(stat, 0)) for p in pokemon_list], key=lambda x: x[1]),
-            "lowest": min([(p.name, p.stats.get(stat, 0)) for p in pokemon_list], key=lambda x: x[1])
-        }
-    
     # Compare types
-    all_types = set()
+    types = {}
     for pokemon in pokemon_list:
         for type_name in pokemon.types:
-            all_types.add(type_name)
+            types.setdefault(type_name, []).append(pokemon.name)
     
-    for type_name in all_types:
-        comparison["types"][type_name] = [p.name for p in pokemon_list if type_name in p.types]
-    
-    # Compare physical attributes
-    comparison["height"]["highest"] = max([(p.name, p.height) for p in pokemon_list], key=lambda x: x[1])
-    comparison["height"]["lowest"] = min([(p.name, p.height) for p in pokemon_list], key=lambda x: x[1])
-    comparison["weight"]["highest"] = max([(p.name, p.weight) for p in pokemon_list], key=lambda x: x[1])
-    comparison["weight"]["lowest"] = min([(p.name, p.weight) for p in pokemon_list], key=lambda x: x[1])
+    # Create comparison data
+    comparison = {
+        "stats": {
+            stat: find_highest_and_lowest(pokemon_list, lambda p: p.stats.get(stat, 0))
+            for stat in COMPARED_STATS
+        },
+        "types": types,
+        "height": find_highest_and_lowest(pokemon_list, lambda p: p.height),
+        "weight": find_highest_and_lowest(pokemon_list, lambda p: p.weight)
+    }
     
-    return ComparisonResult(pokemon=pokemon_list, comparison=comparison)
+    return ComparisonResult.model_construct(pokemon=pokemon_list, comparison=comparison)
 
-@app.get("/pokemon/trainer/{trainer_name}", response_model=List[PokemonDetail], tags=["Pokemon"])
+@app.get(
+    "/pokemon/trainer/{trainer_name}",
+    response_model=None,
+    responses={200: {"model": List[PokemonDetail]}},
+    tags=["Pokemon"]
+)
 async def get_trainer_pokemon(trainer_name: str):
     """
     Get Pokemon associated with a famous trainer like Ash Ketchum
     """
     trainer_name = trainer_name.lower()
-    if trainer_name not in FAMOUS_TRAINERS:
+    pokemon_names = FAMOUS_TRAINERS.get(trainer_name)
+    if pokemon_names is None:
         raise HTTPException(status_code=404, detail=f"Trainer {trainer_name} not found")
     
-    pokemon_names = FAMOUS_TRAINERS[trainer_name]
+    key = f"resp:trainer:{trainer_name}"
+    blob = await cache_get(key)
+    if blob is not None:
+        return json_response(blob)
     
     # Get detailed information for each Pokemon
     tasks = [get_pokemon_details(name) for name in pokemon_names]
@@ -221,7 +535,9 @@ async def get_trainer_pokemon(trainer_name: str):
     
     trainer_pokemon = [result for result in results if result]
     
-    return trainer_pokemon
+    blob = orjson.dumps([pokemon.model_dump() for pokemon in trainer_pokemon])
+    await cache_set(key, blob)
+    return json_response(blob)
 
 @app.get("/pokemon/region/{region_name}", response_model=List[PokemonDetail], tags=["Pokemon"])
 async def get_region_pokemon(region_name: str, limit: int = 20, offset: int = 0):
@@ -229,46 +545,46 @@ async def get_region_pokemon(region_name: str, limit: int = 20, offset: int = 0)
     Get Pokemon from a specific region (Kanto, Johto, Hoenn, etc.)
     """
     region_name = region_name.lower()
-    if region_name not in POKEMON_REGIONS:
+    region_info = POKEMON_REGIONS.get(region_name)
+    if region_info is None:
         raise HTTPException(status_code=404, detail=f"Region {region_name} not found")
     
-    region_info = POKEMON_REGIONS[region_name]
+    # Get the Pokedex for this region
+    pokedex_data = await fetch_pokedex(app.state.http, region_info["pokedex"])
+    if not pokedex_data:
+        raise HTTPException(status_code=500, detail="Failed to fetch region data")
     
-    async with httpx.AsyncClient() as client:
-        # Get the Pokedex for this region
-        response = await client.get(f"{POKEAPI_BASE_URL}/pokedex/{region_info['pokedex']}")
-        if response.status_code != 200:
-            raise HTTPException(status_code=500, detail="Failed to fetch region data")
-        
-        pokedex_data = response.json()
-        pokemon_entries = pokedex_data["pokemon_entries"]
-        
-        # Apply pagination
-        paginated_entries = pokemon_entries[offset:offset+limit]
-        
-        # Get detailed information for each Pokemon
-        tasks = [get_pokemon_details(entry["pokemon_species"]["name"]) for entry in paginated_entries]
-        results = await asyncio.gather(*tasks)
-        
-        region_pokemon = [result for result in results if result]
+    pokemon_entries = pokedex_data["pokemon_entries"]
+    
+    # Apply pagination
+    paginated_entries = pokemon_entries[offset:offset+limit]
+    
+    # Get detailed information for each Pokemon
+    tasks = [get_pokemon_details(entry["pokemon_species"]["name"]) for entry in paginated_entries]
+    results = await asyncio.gather(*tasks)
+    
+    region_pokemon = [result for result in results if result]
     
     return region_pokemon
 
 # Team management endpoints
+def team_key(user_id):
+    """Redis hash holding a user's team as {pokemon_name: pokemon_details_json}"""
+    return f"user:{user_id}:team"
+
+def build_team_response(user_id, blobs):
+    """Build a TeamResponse from the serialized team members stored in Redis"""
+    team = [PokemonDetail.model_construct(**orjson.loads(blob)) for blob in blobs]
+    return TeamResponse.model_construct(user_id=user_id, team=team, team_size=len(team))
+
 @app.get("/team/{user_id}", response_model=TeamResponse, tags=["Team"])
 async def get_team(user_id: str = Path(..., description="User ID to get the team for")):
     """
     Get a user's Pokemon team
     """
-    if user_id not in POKEMON_TEAMS or not POKEMON_TEAMS[user_id]:
-        # Return empty team if user has no team yet
-        return TeamResponse(user_id=user_id, team=[], team_size=0)
-    
-    return TeamResponse(
-        user_id=user_id,
-        team=POKEMON_TEAMS[user_id],
-        team_size=len(POKEMON_TEAMS[user_id])
-    )
+    # A user without a team has no hash, which reads back as an empty team
+    blobs = await app.state.redis.hvals(team_key(user_id))
+    return build_team_response(user_id, blobs)
 
 @app.post("/team/{user_id}/add", response_model=TeamResponse, tags=["Team"])
 async def add_to_team(
@@ -278,20 +594,24 @@ async def add_to_team(
     """
     Add a Pokemon to a user's team (maximum 6 Pokemon per team)
     """
-    # Initialize team if it doesn't exist
-    if user_id not in POKEMON_TEAMS:
-        POKEMON_TEAMS[user_id] = []
+    key = team_key(user_id)
+    team_full = HTTPException(
+        status_code=400, 
+        detail=f"Team is already full (maximum {MAX_TEAM_SIZE} Pokemon). Remove a Pokemon before adding a new one."
+    )
+    
+    # Reject obvious failures before fetching; the add script below re-checks atomically
+    async with app.state.redis.pipeline(transaction=False) as pipe:
+        pipe.hlen(key)
+        pipe.hexists(key, pokemon_request.pokemon_name.lower())
+        team_size, already_in_team = await pipe.execute()
     
     # Check if team is already full
-    if len(POKEMON_TEAMS[user_id]) >= 6:
-        raise HTTPException(
-            status_code=400, 
-            detail="Team is already full (maximum 6 Pokemon). Remove a Pokemon before adding a new one."
-        )
+    if team_size >= MAX_TEAM_SIZE:
+        raise team_full
     
     # Check if Pokemon already exists in team
-    pokemon_names = [p.name for p in POKEMON_TEAMS[user_id]]
-    if pokemon_request.pokemon_name.lower() in pokemon_names:
+    if already_in_team:
         raise HTTPException(
             status_code=400,
             detail=f"Pokemon {pokemon_request.pokemon_name} is already in your team"
@@ -305,14 +625,20 @@ async def add_to_team(
             detail=f"Pokemon {pokemon_request.pokemon_name} not found"
         )
     
-    # Add to team
-    POKEMON_TEAMS[user_id].append(pokemon)
-    
-    return TeamResponse(
-        user_id=user_id,
-        team=POKEMON_TEAMS[user_id],
-        team_size=len(POKEMON_TEAMS[user_id])
+    # Add to team, keyed by the resolved name so adding by id can't create a duplicate
+    result = await app.state.add_team_member(
+        keys=[key],
+        args=[pokemon.name, orjson.dumps(pokemon.model_dump()), MAX_TEAM_SIZE]
     )
+    if result == TEAM_FULL:
+        raise team_full
+    if result == ALREADY_IN_TEAM:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Pokemon {pokemon.name} is already in your team"
+        )
+    
+    return build_team_response(user_id, result)
 
 @app.delete("/team/{user_id}/remove/{pokemon_name}", response_model=TeamResponse, tags=["Team"])
 async def remove_from_team(
@@ -322,48 +648,69 @@ async def remove_from_team(
     """
     Remove a Pokemon from a user's team
     """
+    # Remove Pokemon and read back what's left in one round trip
+    pokemon_name = pokemon_name.lower()
+    async with app.state.redis.pipeline(transaction=True) as pipe:
+        pipe.hdel(team_key(user_id), pokemon_name)
+        pipe.hvals(team_key(user_id))
+        removed, blobs = await pipe.execute()
+    
+    if removed:
+        return build_team_response(user_id, blobs)
+    
     # Check if user has a team
-    if user_id not in POKEMON_TEAMS or not POKEMON_TEAMS[user_id]:
+    if not blobs:
         raise HTTPException(
             status_code=404,
             detail=f"User {user_id} doesn't have a team yet"
         )
     
-    # Find Pokemon in team
-    pokemon_name = pokemon_name.lower()
-    for i, pokemon in enumerate(POKEMON_TEAMS[user_id]):
-        if pokemon.name.lower() == pokemon_name:
-            # Remove Pokemon
-            POKEMON_TEAMS[user_id].pop(i)
-            return TeamResponse(
-                user_id=user_id,
-                team=POKEMON_TEAMS[user_id],
-                team_size=len(POKEMON_TEAMS[user_id])
-            )
-    
     # Pokemon not found in team
     raise HTTPException(
         status_code=404,
         detail=f"Pokemon {pokemon_name} not found in your team"
     )
 
-@app.get("/pokemon/{name_or_id}", response_model=PokemonDetail, tags=["Pokemon"])
+@app.get(
+    "/pokemon/{name_or_id}",
+    response_model=None,
+    responses={200: {"model": PokemonDetail}},
+    tags=["Pokemon"]
+)
 async def get_pokemon(name_or_id: str):
     """
     Get detailed information about a specific Pokemon by name or ID
     """
-    pokemon = await get_pokemon_details(name_or_id)
-    if not pokemon:
-        raise HTTPException(status_code=404, detail=f"Pokemon {name_or_id} not found")
-    return pokemon
+    key = f"resp:pokemon:{name_or_id.lower()}"
+    blob = await cache_get(key)
+    if blob is None:
+        pokemon = await get_pokemon_details(name_or_id)
+        if not pokemon:
+            raise HTTPException(status_code=404, detail=f"Pokemon {name_or_id} not found")
+        blob = orjson.dumps(pokemon.model_dump())
+        await cache_set(key, blob)
+    return json_response(blob)
 
 mcp.setup_server()
 
 
 
 def main():
+    import sys
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Teams and caches live in Redis, so workers agree on state. The PokeAPI
+        # concurrency cap, circuit breaker, fetch coalescing and startup prewarm are
+        # per worker, so upstream load scales with this count; lower it if PokeAPI
+        # starts rate limiting
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
 
 if __name__ == "__main__":
     main()